@@ -2,16 +2,22 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 import uvicorn
+import json
 import sys
 import os
+import time
+from urllib.parse import parse_qs
 
 # Add the parent directory to sys.path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from language_core import metrics
 from language_core.config import load_config
 from language_core.phonology import PhonologyGenerator
+from language_core.writing import WritingSystemGenerator
 
 app = FastAPI()
 
@@ -30,6 +36,82 @@ class TranslationRequest(BaseModel):
 # Store active languages
 active_languages = {}
 
+class InstrumentationMiddleware:
+    """Time every request and, with ``?profile=true``, sample its stacks.
+    
+    Plain ASGI middleware: while metrics are disabled requests are passed
+    straight through, and profiling is only available while they are enabled.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not metrics.is_enabled():
+            return await self.app(scope, receive, send)
+        
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        profile = query.get("profile", [""])[-1].lower() in ("1", "true", "yes")
+        profiler = metrics.SamplingProfiler() if profile else None
+        messages = []
+        status = 500
+        
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            if profiler:
+                # Hold the response so the profile can be added to its body
+                messages.append(message)
+            else:
+                await send(message)
+        
+        if profiler:
+            profiler.start()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            if profiler:
+                profiler.stop()
+            # Label by route template so /api/translate/{language_id} is one
+            # series, and unmatched paths cannot create new series
+            route = scope.get("route")
+            endpoint = getattr(route, "path", "<unmatched>")
+            metrics.observe("request_seconds", elapsed, endpoint=endpoint)
+            metrics.increment("requests_total", endpoint=endpoint, status=str(status))
+        
+        if profiler:
+            for message in _add_profile(messages, profiler.top()):
+                await send(message)
+
+def _add_profile(messages, profile):
+    """Add the profile to a buffered JSON response, fixing its length."""
+    start = next((m for m in messages if m["type"] == "http.response.start"), None)
+    headers = dict(start["headers"]) if start else {}
+    if headers.get(b"content-type") != b"application/json":
+        return messages
+    body = b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+    content = json.loads(body)
+    if not isinstance(content, dict):
+        return messages
+    content["profile"] = profile
+    body = json.dumps(content).encode("utf-8")
+    headers[b"content-length"] = str(len(body)).encode("latin-1")
+    return [
+        {**start, "headers": list(headers.items())},
+        {"type": "http.response.body", "body": body},
+    ]
+
+app.add_middleware(InstrumentationMiddleware)
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Expose recorded metrics in the Prometheus text format."""
+    return PlainTextResponse(metrics.render_prometheus(),
+                             media_type="text/plain; version=0.0.4")
+
 @app.get("/")
 async def root():
     return {"message": "Language Generator API is running"}
@@ -40,6 +122,7 @@ async def create_language():
     try:
         config = load_config()
         generator = PhonologyGenerator(config)
+        writing = WritingSystemGenerator(config).generate()
         
         # Generate some example words
         example_words = [generator.generate_word() for _ in range(5)]
@@ -48,8 +131,11 @@ async def create_language():
         import uuid
         language_id = str(uuid.uuid4())
         
-        # Store the generator
-        active_languages[language_id] = generator
+        # Store the generator and its orthography
+        active_languages[language_id] = {
+            'phonology': generator,
+            'orthography': writing['orthography'],
+        }
         
         # Get all phonemes (both consonants and vowels)
         all_phonemes = [str(p) for p in generator.consonants + generator.vowels]
@@ -58,9 +144,13 @@ async def create_language():
             "id": language_id,
             "phonemes": all_phonemes,
             "syllable_structure": generator.syllable_structure,
-            "example_words": example_words
+            "example_words": example_words,
+            "writing_system": writing['type'],
+            "graphemes": writing['graphemes'],
+            "written_words": writing['orthography'].write_many(example_words)
         }
     except Exception as e:
+        metrics.increment("request_errors_total")
         return {"error": str(e)}
 
 @app.post("/api/translate/{language_id}")
@@ -70,20 +160,24 @@ async def translate_text(language_id: str, request: TranslationRequest):
         return {"error": "Language not found"}
     
     try:
-        generator = active_languages[language_id]
+        generator = active_languages[language_id]['phonology']
+        orthography = active_languages[language_id]['orthography']
         
         # Split the text into words
         words = request.text.strip().lower().split()
         
         # Generate a unique word for each English word
         translated_words = [generator.generate_word() for _ in words]
+        metrics.increment("translated_words_total", len(words))
         
         return {
             "original": request.text,
             "translated": " ".join(translated_words),
+            "written": " ".join(orthography.write_many(translated_words)),
             "word_mapping": dict(zip(words, translated_words))
         }
     except Exception as e:
+        metrics.increment("request_errors_total")
         return {"error": str(e)}
 
 if __name__ == "__main__":
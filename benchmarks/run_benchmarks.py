@@ -0,0 +1,281 @@
+"""Benchmark suite for language generation hot paths.
+
+Measures throughput and peak memory of the core generators and the latency
+of the API endpoints (through an in-process ASGI client, so no server or
+network is needed). Results are written as JSON and can be compared against
+an earlier run to catch regressions:
+
+    python benchmarks/run_benchmarks.py --quick
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/old.json
+"""
+
+from typing import Dict, List, Any, Callable, Optional
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import pickle
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'backend'))
+
+from language_core.base import LanguageGenerator
+from language_core.config import load_config
+from language_core.grammar import GrammarGenerator
+from language_core.phonology import PhonologyGenerator
+from language_core.vocabulary import VocabularyGenerator
+from language_core.writing import WritingSystemGenerator
+
+VOCABULARY_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+QUICK_VOCABULARY_SIZES = [1_000, 10_000]
+
+TRANSLATE_TEXT = "the quick brown fox jumps over the lazy dog"
+
+
+def seed_everything(seed: int) -> None:
+    """Seed every random source used by the generators."""
+    random.seed(seed)
+    np.random.seed(seed)
+
+
+def measure(func: Callable[[], Any], ops: int, repeat: int, seed: int,
+            setup: Optional[Callable[[], Any]] = None) -> Dict[str, Any]:
+    """Time func (best of repeat runs) and record its peak memory once.
+
+    ``setup`` runs untimed before every run, e.g. to restore state that
+    func modifies.
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        seed_everything(seed)
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    if setup:
+        setup()
+    seed_everything(seed)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = min(timings)
+    return {
+        'ops': ops,
+        'seconds': best,
+        'ops_per_sec': ops / best if best else float('inf'),
+        'peak_kb': peak / 1024,
+    }
+
+
+def bench_phonology(config: Dict[str, Any], n: int, repeat: int, seed: int) -> Dict[str, Any]:
+    """Benchmark PhonologyGenerator.generate_word and is_valid_word."""
+    phonology = PhonologyGenerator(config)
+    seed_everything(seed)
+    words = [phonology.generate_word() for _ in range(n)]
+    return {
+        'phonology.generate_word': measure(
+            lambda: [phonology.generate_word() for _ in range(n)], n, repeat, seed),
+        'phonology.is_valid_word': measure(
+            lambda: [phonology.is_valid_word(w) for w in words], n, repeat, seed),
+    }
+
+
+def bench_vocabulary(config: Dict[str, Any], sizes: List[int], repeat: int,
+                     seed: int) -> Dict[str, Any]:
+    """Benchmark VocabularyGenerator.generate_basic_vocabulary and morphology."""
+    results = {}
+    vocab_gen = VocabularyGenerator(config)
+    for size in sizes:
+        # Large sizes take long enough that a single run is representative
+        runs = repeat if size <= 10_000 else 1
+        results[f'vocabulary.generate_basic_vocabulary[{size}]'] = measure(
+            lambda: vocab_gen.generate_basic_vocabulary(size), size, runs, seed)
+
+    seed_everything(seed)
+    basic = vocab_gen.generate_basic_vocabulary(sizes[0])
+    morphology = GrammarGenerator(config).generate_morphology()
+    words = [word for pos_words in basic.values() for word in pos_words]
+
+    def expand():
+        for word in words:
+            vocab_gen.apply_morphology(word, morphology)
+
+    results[f'vocabulary.apply_morphology[{len(words)}]'] = measure(
+        expand, len(words), repeat, seed)
+
+    # Incremental growth should cost the same regardless of lexicon size.
+    # Every run extends a fresh copy of the same lexicon, with a different
+    # seed than the one that built it so new forms don't all collide.
+    seed_everything(seed)
+    vocab_gen.generate()
+    vocab_gen.extend(sizes[-1])
+    snapshot = pickle.dumps(vocab_gen)
+    current = {}
+
+    def restore():
+        current['generator'] = pickle.loads(snapshot)
+
+    results[f'vocabulary.extend[500 onto {sizes[-1]}]'] = measure(
+        lambda: current['generator'].extend(500), 500, repeat, seed + 1, setup=restore)
+    return results
+
+
+def bench_language(config: Dict[str, Any], n: int, repeat: int, seed: int) -> Dict[str, Any]:
+    """Benchmark LanguageGenerator.generate_language with all components."""
+    def generate():
+        for _ in range(n):
+            generator = LanguageGenerator(config)
+            generator.add_component('grammar', GrammarGenerator(config))
+            generator.add_component('vocabulary', VocabularyGenerator(config))
+            generator.add_component('writing', WritingSystemGenerator(config))
+            generator.generate_language()
+
+    return {'language.generate_language': measure(generate, n, repeat, seed)}
+
+
+def latency_stats(latencies: List[float]) -> Dict[str, Any]:
+    """Summarize request latencies in milliseconds."""
+    latencies = sorted(latency * 1000 for latency in latencies)
+    total = sum(latencies) / 1000
+    return {
+        'ops': len(latencies),
+        'seconds': total,
+        'ops_per_sec': len(latencies) / total if total else float('inf'),
+        'p50_ms': statistics.median(latencies),
+        'p95_ms': latencies[int(0.95 * (len(latencies) - 1))],
+        'max_ms': latencies[-1],
+    }
+
+
+async def _bench_api(n: int) -> Dict[str, Any]:
+    import httpx
+    from main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+        create_latencies = []
+        language_id = None
+        for _ in range(n):
+            start = time.perf_counter()
+            response = await client.post('/api/create-language')
+            create_latencies.append(time.perf_counter() - start)
+            language_id = response.json()['id']
+
+        translate_latencies = []
+        for _ in range(n):
+            start = time.perf_counter()
+            await client.post(f'/api/translate/{language_id}', json={'text': TRANSLATE_TEXT})
+            translate_latencies.append(time.perf_counter() - start)
+
+    return {
+        'api.create_language': latency_stats(create_latencies),
+        'api.translate': latency_stats(translate_latencies),
+    }
+
+
+def bench_api(n: int, seed: int) -> Dict[str, Any]:
+    """Benchmark end-to-end /api/create-language and /api/translate latency."""
+    seed_everything(seed)
+    return asyncio.run(_bench_api(n))
+
+
+def run(quick: bool = False, repeat: int = 3, seed: int = 0,
+        skip_api: bool = False) -> Dict[str, Any]:
+    """Run the whole suite and return the results document."""
+    config = load_config()
+    sizes = QUICK_VOCABULARY_SIZES if quick else VOCABULARY_SIZES
+    n = 1_000 if quick else 10_000
+
+    results = {}
+    results.update(bench_phonology(config, n * 10, repeat, seed))
+    results.update(bench_vocabulary(config, sizes, repeat, seed))
+    results.update(bench_language(config, 3 if quick else 10, repeat, seed))
+    if not skip_api:
+        results.update(bench_api(50 if quick else 500, seed))
+
+    return {
+        'meta': {
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'quick': quick,
+            'repeat': repeat,
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any],
+            threshold: float) -> List[str]:
+    """Print throughput changes and return the benchmarks that regressed."""
+    regressions = []
+    for name, result in current['results'].items():
+        old = baseline['results'].get(name)
+        if not old:
+            continue
+        ratio = result['ops_per_sec'] / old['ops_per_sec']
+        flag = ''
+        if ratio < 1 - threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print(f"{name:50s} {old['ops_per_sec']:14.1f} -> {result['ops_per_sec']:14.1f} "
+              f"ops/s ({ratio:6.2f}x){flag}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--quick', action='store_true',
+                        help='small sizes only, for a fast smoke run')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='timed runs per benchmark (best is kept)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--skip-api', action='store_true',
+                        help='skip the ASGI endpoint benchmarks')
+    parser.add_argument('--output', help='result file (default: benchmarks/results/<time>.json)')
+    parser.add_argument('--compare', help='earlier result file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='relative throughput drop reported as a regression')
+    args = parser.parse_args(argv)
+
+    report = run(quick=args.quick, repeat=args.repeat, seed=args.seed,
+                 skip_api=args.skip_api)
+
+    output = args.output
+    if not output:
+        stamp = datetime.datetime.now().strftime('%Y%m%d-%H%M%S')
+        output = os.path.join(ROOT, 'benchmarks', 'results', f'{stamp}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    for name, result in report['results'].items():
+        print(f"{name:50s} {result['ops_per_sec']:14.1f} ops/s")
+    print(f"\nResults saved to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f"\nComparison with {args.compare}:")
+        if compare(report, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
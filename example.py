@@ -1,6 +1,7 @@
 from language_core.base import LanguageGenerator
 from language_core.grammar import GrammarGenerator
 from language_core.vocabulary import VocabularyGenerator
+from language_core.writing import WritingSystemGenerator
 
 def main():
     # Configuration for the language generation
@@ -17,9 +18,11 @@ def main():
     # Add components
     grammar_gen = GrammarGenerator(config)
     vocab_gen = VocabularyGenerator(config)
+    writing_gen = WritingSystemGenerator(config)
     
     lang_gen.add_component('grammar', grammar_gen)
     lang_gen.add_component('vocabulary', vocab_gen)
+    lang_gen.add_component('writing', writing_gen)
     
     # Generate the language
     language = lang_gen.generate_language()
@@ -36,12 +39,15 @@ def main():
         for feature, values in features.items():
             print(f"  {feature}: {', '.join(values)}")
             
+    orthography = language['writing']['orthography']
+    print(f"\nWriting System: {language['writing']['type']}")
+    
     print("\nSample Vocabulary:")
     for pos, words in language['vocabulary'].items():
         print(f"\n{pos} examples:")
         # Print first 5 words of each type
         for word in words[:5]:
-            print(f"- {word}")
+            print(f"- {word} [{orthography.write(word.form)}]")
 
 if __name__ == "__main__":
     main()
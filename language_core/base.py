@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any
 import numpy as np
+from . import metrics
 
 class LanguageComponent(ABC):
     """Base class for all language generation components."""
@@ -41,22 +42,27 @@ class LanguageGenerator:
     def generate_language(self) -> Dict[str, Any]:
         """Generate a complete language using all components."""
         language = {}
+        metrics.increment('languages_generated_total')
         
         # Generate grammar rules
         if 'grammar' in self.components:
-            language['grammar'] = self.components['grammar'].generate()
+            with metrics.timer('component_generate_seconds', component='grammar'):
+                language['grammar'] = self.components['grammar'].generate()
             
         # Generate vocabulary
         if 'vocabulary' in self.components:
-            language['vocabulary'] = self.components['vocabulary'].generate()
+            with metrics.timer('component_generate_seconds', component='vocabulary'):
+                language['vocabulary'] = self.components['vocabulary'].generate()
             
         # Generate writing system
         if 'writing' in self.components:
-            language['writing'] = self.components['writing'].generate()
+            with metrics.timer('component_generate_seconds', component='writing'):
+                language['writing'] = self.components['writing'].generate()
             
         # Generate phonetics
         if 'phonetics' in self.components:
-            language['phonetics'] = self.components['phonetics'].generate()
+            with metrics.timer('component_generate_seconds', component='phonetics'):
+                language['phonetics'] = self.components['phonetics'].generate()
             
         return language
     
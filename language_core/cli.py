@@ -0,0 +1,235 @@
+"""Command-line tool for generating many languages in parallel.
+
+Languages are split into shards; each shard is generated by a worker process
+and written as a gzip-compressed JSON Lines file. A shard file only appears
+once it is complete, so an interrupted run can be resumed with ``--resume``
+and only the missing shards are generated.
+
+    languagegen --count 10000 --output out/
+    languagegen --count 10000 --output out/ --grid grid.yaml --resume
+"""
+
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import argparse
+import contextlib
+import gzip
+import itertools
+import json
+import os
+import random
+import sys
+
+import numpy as np
+import yaml
+from tqdm import tqdm
+
+from .base import LanguageGenerator
+from .config import compile_config, deep_merge, load_config, thaw
+from .grammar import GrammarGenerator
+from .vocabulary import VocabularyGenerator
+from .writing import WritingSystemGenerator
+
+MANIFEST = 'manifest.json'
+
+# Config sections the generators read; grid keys elsewhere would have no effect
+GRID_SECTIONS = ('phonology', 'vocabulary', 'writing')
+
+
+def expand_grid(grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Expand ``{'dotted.key': [values]}`` into nested config overrides.
+
+    Every combination of values becomes one variation.
+    """
+    if not isinstance(grid, Mapping):
+        raise ValueError("Grid must map dotted config keys to lists of values")
+    if not grid:
+        return [{}]
+    keys = sorted(grid)
+    for key in keys:
+        if not isinstance(key, str) or key.split('.')[0] not in GRID_SECTIONS:
+            raise ValueError(f"Grid key {key!r} is not used by the generators; "
+                             f"keys must start with one of {GRID_SECTIONS}")
+        if not isinstance(grid[key], list) or not grid[key]:
+            raise ValueError(f"Grid key {key!r} must map to a non-empty list of values")
+    variations = []
+    for values in itertools.product(*(grid[key] for key in keys)):
+        variation: Dict[str, Any] = {}
+        for key, value in zip(keys, values):
+            node = variation
+            *parents, leaf = key.split('.')
+            for parent in parents:
+                node = node.setdefault(parent, {})
+            node[leaf] = value
+        variations.append(variation)
+    return variations
+
+
+def language_seed(seed: int, index: int) -> int:
+    """Seed for the language at index, stable across runs and workers."""
+    return (seed * 1_000_003 + index) % 2**32
+
+
+def serialize_language(language: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a generated language into JSON-compatible data."""
+    data: Dict[str, Any] = {}
+    if 'grammar' in language:
+        grammar = language['grammar']
+        data['grammar'] = {
+            'word_order': list(grammar['word_order']),
+            'phrase_structure': [str(rule) for rule in grammar['phrase_structure']],
+            'morphology': grammar['morphology'],
+        }
+    orthography = None
+    if 'writing' in language:
+        writing = language['writing']
+        orthography = writing['orthography']
+        data['writing'] = {
+            'type': writing['type'],
+            'graphemes': writing['graphemes'],
+            'separator': writing['separator'],
+        }
+    if 'vocabulary' in language:
+        data['vocabulary'] = {}
+        for pos, words in language['vocabulary'].items():
+            written = orthography.write_many(w.form for w in words) if orthography else None
+            entries = []
+            for i, word in enumerate(words):
+                entry = {'form': word.form, 'meaning': word.meaning}
+                if word.morphology:
+                    entry['morphology'] = word.morphology
+                if written:
+                    entry['written'] = written[i]
+                entries.append(entry)
+            data['vocabulary'][pos] = entries
+    return data
+
+
+def generate_one(config: Dict[str, Any], seed: int) -> Dict[str, Any]:
+    """Generate a single language deterministically from its seed."""
+    random.seed(seed)
+    np.random.seed(seed)
+    generator = LanguageGenerator(config)
+    generator.add_component('grammar', GrammarGenerator(config))
+    generator.add_component('vocabulary', VocabularyGenerator(config))
+    generator.add_component('writing', WritingSystemGenerator(config))
+    return serialize_language(generator.generate_language())
+
+
+def shard_path(output: str, shard: int) -> str:
+    return os.path.join(output, f'shard-{shard:05d}.jsonl.gz')
+
+
+def generate_shard(output: str, shard: int, indices: List[int], seed: int,
+                   base_config: Dict[str, Any],
+                   variations: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """Generate the languages of one shard and write them atomically."""
+    path = shard_path(output, shard)
+    tmp_path = path + '.tmp'
+    try:
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            for index in indices:
+                variation = index % len(variations)
+                config = compile_config(deep_merge(base_config, variations[variation]))
+                record = {
+                    'index': index,
+                    'seed': language_seed(seed, index),
+                    'variation': variation,
+                    'language': generate_one(config, language_seed(seed, index)),
+                }
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    except BaseException:
+        # gzip.open may fail before the file is created
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+    return shard, len(indices)
+
+
+def check_manifest(output: str, manifest: Dict[str, Any], resume: bool) -> None:
+    """Write the run manifest, or check it matches the run being resumed."""
+    path = os.path.join(output, MANIFEST)
+    if os.path.exists(path):
+        if not resume:
+            raise SystemExit(f"{output} already contains a run; pass --resume to continue it")
+        with open(path) as f:
+            existing = json.load(f)
+        if existing != manifest:
+            raise SystemExit(f"{output} contains a run with different settings; "
+                             "use a new output directory")
+        return
+    with open(path, 'w') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='languagegen', description='Generate many languages in parallel.')
+    parser.add_argument('--count', type=int, required=True,
+                        help='number of languages to generate')
+    parser.add_argument('--output', required=True, help='output directory')
+    parser.add_argument('--config', help='YAML config merged over the defaults')
+    parser.add_argument('--grid', help='YAML file mapping dotted config keys to lists '
+                        'of values; languages cycle through every combination')
+    parser.add_argument('--seed', type=int, default=0, help='base random seed')
+    parser.add_argument('--shard-size', type=int, default=100,
+                        help='languages per output file')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='worker processes (1 runs in-process)')
+    parser.add_argument('--resume', action='store_true',
+                        help='continue an interrupted run, skipping finished shards')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.count < 0 or args.shard_size < 1 or args.workers < 1:
+        raise SystemExit("--count must be >= 0, --shard-size and --workers >= 1")
+
+    base_config = thaw(load_config(args.config))
+    grid = {}
+    if args.grid:
+        with open(args.grid) as f:
+            grid = yaml.safe_load(f) or {}
+    # Fail fast on invalid variations instead of inside the workers
+    try:
+        variations = expand_grid(grid)
+        for variation in variations:
+            compile_config(deep_merge(base_config, variation))
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+    os.makedirs(args.output, exist_ok=True)
+    check_manifest(args.output, {
+        'count': args.count,
+        'seed': args.seed,
+        'shard_size': args.shard_size,
+        'config': base_config,
+        'variations': variations,
+    }, args.resume)
+
+    shards = {}
+    for shard, start in enumerate(range(0, args.count, args.shard_size)):
+        if not os.path.exists(shard_path(args.output, shard)):
+            shards[shard] = list(range(start, min(start + args.shard_size, args.count)))
+
+    done = args.count - sum(len(indices) for indices in shards.values())
+    with tqdm(total=args.count, initial=done, unit='lang') as progress:
+        if args.workers == 1:
+            for shard, indices in shards.items():
+                generate_shard(args.output, shard, indices, args.seed, base_config, variations)
+                progress.update(len(indices))
+        else:
+            with ProcessPoolExecutor(max_workers=args.workers) as pool:
+                futures = [pool.submit(generate_shard, args.output, shard, indices,
+                                       args.seed, base_config, variations)
+                           for shard, indices in shards.items()]
+                for future in as_completed(futures):
+                    _, generated = future.result()
+                    progress.update(generated)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
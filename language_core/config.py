@@ -1,6 +1,9 @@
 """Configuration settings for language generation."""
 
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Hashable, Iterator, Mapping, Optional, Tuple
+from collections import OrderedDict
+from functools import lru_cache
+import os
 import yaml
 
 DEFAULT_CONFIG = {
@@ -40,16 +43,239 @@ DEFAULT_CONFIG = {
     }
 }
 
-def load_config(config_path: str = None) -> Dict[str, Any]:
-    """Load configuration from file or return default config."""
-    if config_path:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-            # Merge with defaults for any missing values
-            return {**DEFAULT_CONFIG, **config}
-    return DEFAULT_CONFIG.copy()
+COMPLEXITIES = ('simple', 'medium', 'complex')
+WORD_ORDERS = ('SVO', 'SOV', 'VSO')
+ALIGNMENTS = ('nominative-accusative', 'ergative-absolutive')
+MORPHOLOGY_TYPES = ('isolating', 'agglutinative', 'fusional')
 
-def save_config(config: Dict[str, Any], config_path: str) -> None:
+# Settings that are replaced as a whole rather than merged key by key, so an
+# override can drop entries (e.g. a part of speech) from the default
+REPLACED_KEYS = {('vocabulary', 'distribution')}
+
+# Upper bound on cached compiled configs and derived artifacts
+CACHE_SIZE = 128
+WRITING_TYPES = ('alphabet', 'digraph', 'syllabary')
+
+
+class FrozenConfig(Mapping):
+    """Immutable, hashable mapping used for compiled configurations.
+
+    Nested dicts are frozen recursively and lists become tuples, so a
+    compiled config can be used as a cache key.
+    """
+
+    __slots__ = ('_data', '_hash')
+
+    def __init__(self, data: Mapping):
+        self._data = {key: freeze(value) for key, value in data.items()}
+        self._hash = None
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data.items()))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"FrozenConfig({self._data!r})"
+
+    def __reduce__(self):
+        # Rebuild on unpickling: the cached hash is only valid in this process
+        return (FrozenConfig, (self._data,))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a mutable deep copy as plain dicts and lists."""
+        return thaw(self)
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists into hashable equivalents."""
+    if isinstance(value, FrozenConfig):
+        return value
+    if isinstance(value, Mapping):
+        return FrozenConfig(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively convert frozen values back into dicts and lists."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+
+def deep_merge(base: Mapping, override: Mapping, _path: Tuple[str, ...] = ()) -> Dict[str, Any]:
+    """Merge override into base, recursing into nested dicts.
+
+    Keys listed in ``REPLACED_KEYS`` are replaced instead of merged. Neither
+    argument is modified; the result shares no mutable state with them.
+    """
+    merged = thaw(base)
+    for key, value in override.items():
+        path = _path + (key,)
+        if (isinstance(value, Mapping) and isinstance(merged.get(key), dict)
+                and path not in REPLACED_KEYS):
+            merged[key] = deep_merge(merged[key], value, path)
+        else:
+            merged[key] = thaw(value)
+    return merged
+
+
+def _check(condition: bool, message: str) -> None:
+    if not condition:
+        raise ValueError(f"Invalid config: {message}")
+
+
+def _is_int(value: Any) -> bool:
+    # bool is a subclass of int but never a valid count
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def validate_config(config: Mapping) -> None:
+    """Raise ValueError if a merged configuration is not usable."""
+    for section in DEFAULT_CONFIG:
+        _check(isinstance(config.get(section), Mapping), f"{section} must be a mapping")
+
+    language = config['language']
+    _check(language['complexity'] in COMPLEXITIES,
+           f"language.complexity must be one of {COMPLEXITIES}")
+
+    phonology = config['phonology']
+    consonants, vowels = phonology['consonants'], phonology['vowels']
+    _check(isinstance(consonants, str) and consonants,
+           "phonology.consonants must be a non-empty string")
+    _check(isinstance(vowels, str) and vowels,
+           "phonology.vowels must be a non-empty string")
+    _check(not set(consonants) & set(vowels),
+           "phonology.consonants and phonology.vowels overlap")
+    structures = phonology['syllable_structure']
+    _check(isinstance(structures, (list, tuple)) and structures
+           and all(isinstance(s, str) and s and set(s) <= {'C', 'V'} for s in structures),
+           "phonology.syllable_structure must be a non-empty list of C/V patterns")
+    max_syllables = phonology['max_syllables']
+    _check(_is_int(max_syllables) and max_syllables >= 1,
+           "phonology.max_syllables must be a positive integer")
+
+    grammar = config['grammar']
+    _check(grammar['word_order'] in WORD_ORDERS,
+           f"grammar.word_order must be one of {WORD_ORDERS}")
+    _check(grammar['alignment'] in ALIGNMENTS,
+           f"grammar.alignment must be one of {ALIGNMENTS}")
+    _check(grammar['morphology_type'] in MORPHOLOGY_TYPES,
+           f"grammar.morphology_type must be one of {MORPHOLOGY_TYPES}")
+
+    vocabulary = config['vocabulary']
+    size = vocabulary['initial_size']
+    _check(_is_int(size) and size >= 0,
+           "vocabulary.initial_size must be a non-negative integer")
+    distribution = vocabulary['distribution']
+    _check(isinstance(distribution, Mapping),
+           "vocabulary.distribution must be a mapping")
+    _check(all(_is_number(p) and p >= 0 for p in distribution.values()),
+           "vocabulary.distribution values must be non-negative numbers")
+    _check(abs(sum(distribution.values()) - 1) < 1e-6,
+           "vocabulary.distribution values must add up to 1")
+
+    # The writing section is optional; a missing type is picked at random
+    writing = config.get('writing', {})
+    _check(isinstance(writing, Mapping), "writing must be a mapping")
+    writing_type = writing.get('type')
+    _check(writing_type is None or writing_type in WRITING_TYPES,
+           f"writing.type must be one of {WRITING_TYPES}")
+    separator = writing.get('separator', "'")
+    _check(isinstance(separator, str) and separator
+           and not set(separator) & set(consonants + vowels),
+           "writing.separator must be a non-empty string of non-phoneme characters")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compile(overrides: FrozenConfig) -> FrozenConfig:
+    merged = deep_merge(DEFAULT_CONFIG, overrides)
+    validate_config(merged)
+    return FrozenConfig(merged)
+
+
+def compile_config(config: Optional[Mapping] = None) -> FrozenConfig:
+    """Merge config over the defaults, validate it and freeze the result.
+
+    Compiled configs are cached per process, so repeated calls with an
+    equal config return the same object without re-validating.
+    """
+    if config is None:
+        config = {}
+    _check(isinstance(config, Mapping), "top level must be a mapping")
+    return _compile(freeze(config))
+
+
+# path -> (mtime_ns, size, compiled config); only the latest version is kept
+_FILE_CACHE: Dict[str, Tuple[int, int, FrozenConfig]] = {}
+_ARTIFACT_CACHE: 'OrderedDict[Tuple[Hashable, FrozenConfig], Any]' = OrderedDict()
+
+
+def load_config(config_path: str = None) -> FrozenConfig:
+    """Load configuration from file or return default config.
+
+    The file is only re-parsed when its modification time or size changes.
+    Use ``to_dict()`` on the result for a mutable copy.
+    """
+    if not config_path:
+        return compile_config()
+
+    path = os.path.abspath(config_path)
+    stat = os.stat(path)
+    cached = _FILE_CACHE.get(path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    with open(path, 'r') as f:
+        config = yaml.safe_load(f)
+    compiled = compile_config(config)
+    _FILE_CACHE[path] = (stat.st_mtime_ns, stat.st_size, compiled)
+    return compiled
+
+
+def cached_artifact(name: Hashable, config: Mapping, build: Callable[[], Any]) -> Any:
+    """Return the artifact built from config, building it at most once.
+
+    ``name`` identifies the kind of artifact (e.g. a phoneme table) and
+    ``config`` the (section of the) configuration it is derived from. The
+    least recently used artifacts are dropped beyond ``CACHE_SIZE``.
+    """
+    key = (name, freeze(config))
+    if key in _ARTIFACT_CACHE:
+        _ARTIFACT_CACHE.move_to_end(key)
+        return _ARTIFACT_CACHE[key]
+    artifact = _ARTIFACT_CACHE[key] = build()
+    if len(_ARTIFACT_CACHE) > CACHE_SIZE:
+        _ARTIFACT_CACHE.popitem(last=False)
+    return artifact
+
+
+def clear_config_cache() -> None:
+    """Drop all cached configs and derived artifacts."""
+    _compile.cache_clear()
+    _FILE_CACHE.clear()
+    _ARTIFACT_CACHE.clear()
+
+
+def save_config(config: Mapping, config_path: str) -> None:
     """Save configuration to file."""
     with open(config_path, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False)
+        yaml.dump(thaw(config), f, default_flow_style=False)
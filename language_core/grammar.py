@@ -29,7 +29,8 @@ class GrammarGenerator(LanguageComponent):
             ['SUBJ', 'OBJ', 'VERB'],  # SOV
             ['VERB', 'SUBJ', 'OBJ'],  # VSO
         ]
-        return np.random.choice(possible_orders)
+        # np.random.choice only accepts 1-D input, so pick an index instead
+        return possible_orders[np.random.randint(len(possible_orders))]
     
     def generate_phrase_structure(self) -> List[GrammarRule]:
         """Generate phrase structure rules."""
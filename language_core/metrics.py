@@ -0,0 +1,220 @@
+"""Opt-in metrics and profiling instrumentation.
+
+Counters and timers are recorded only while instrumentation is enabled
+(``enable()`` or the ``LANGUAGEGEN_METRICS=1`` environment variable). When
+disabled, ``increment`` returns immediately and ``timer`` hands back a shared
+no-op context manager, so instrumented hot paths pay a single flag check.
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+from collections import Counter
+import os
+import sys
+import threading
+import time
+
+PREFIX = 'languagegen_'
+
+_enabled = os.environ.get('LANGUAGEGEN_METRICS', '').lower() in ('1', 'true', 'yes')
+_lock = threading.Lock()
+_counters: Dict[Tuple[str, Tuple], float] = {}
+_timers: Dict[Tuple[str, Tuple], List[float]] = {}  # [count, sum, max]
+
+
+def enable() -> None:
+    """Start recording metrics."""
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    """Stop recording metrics; recorded values are kept."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    """Return whether metrics are being recorded."""
+    return _enabled
+
+
+def reset() -> None:
+    """Drop all recorded metrics."""
+    with _lock:
+        _counters.clear()
+        _timers.clear()
+
+
+def increment(name: str, value: float = 1, **labels: str) -> None:
+    """Add value to a counter."""
+    if not _enabled:
+        return
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def observe(name: str, seconds: float, **labels: str) -> None:
+    """Record one duration for a timer."""
+    if not _enabled:
+        return
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        stats = _timers.get(key)
+        if stats is None:
+            _timers[key] = [1, seconds, seconds]
+        else:
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+
+
+class _Timer:
+    """Context manager that records the duration of its block."""
+
+    __slots__ = ('name', 'labels', 'start')
+
+    def __init__(self, name: str, labels: Dict[str, str]):
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self) -> '_Timer':
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        observe(self.name, time.perf_counter() - self.start, **self.labels)
+
+
+class _NullTimer:
+    """No-op stand-in for _Timer used while metrics are disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullTimer':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def timer(name: str, **labels: str):
+    """Return a context manager timing its block under name."""
+    if not _enabled:
+        return _NULL_TIMER
+    return _Timer(name, labels)
+
+
+def snapshot() -> Dict[str, Any]:
+    """Return all recorded metrics as plain data.
+
+    Counters map to ``{labels: value}`` and timers to
+    ``{labels: {'count', 'sum', 'max'}}``, where labels is a tuple of
+    (name, value) pairs.
+    """
+    with _lock:
+        counters: Dict[str, Dict] = {}
+        for (name, labels), value in _counters.items():
+            counters.setdefault(name, {})[labels] = value
+        timers: Dict[str, Dict] = {}
+        for (name, labels), (count, total, longest) in _timers.items():
+            timers.setdefault(name, {})[labels] = {
+                'count': count, 'sum': total, 'max': longest}
+    return {'counters': counters, 'timers': timers}
+
+
+def _format_labels(labels: Tuple) -> str:
+    if not labels:
+        return ''
+    pairs = ','.join('{}="{}"'.format(key, str(value).replace('"', '\\"'))
+                     for key, value in labels)
+    return '{' + pairs + '}'
+
+
+def render_prometheus() -> str:
+    """Render all recorded metrics in the Prometheus text exposition format."""
+    data = snapshot()
+    lines = []
+    for name, series in sorted(data['counters'].items()):
+        metric = PREFIX + name
+        lines.append(f'# TYPE {metric} counter')
+        for labels, value in sorted(series.items()):
+            lines.append(f'{metric}{_format_labels(labels)} {value}')
+    for name, series in sorted(data['timers'].items()):
+        metric = PREFIX + name
+        lines.append(f'# TYPE {metric} summary')
+        for labels, stats in sorted(series.items()):
+            label_text = _format_labels(labels)
+            lines.append(f'{metric}_count{label_text} {stats["count"]}')
+            lines.append(f'{metric}_sum{label_text} {stats["sum"]}')
+        lines.append(f'# TYPE {metric}_max gauge')
+        for labels, stats in sorted(series.items()):
+            lines.append(f'{metric}_max{_format_labels(labels)} {stats["max"]}')
+    return '\n'.join(lines) + '\n' if lines else ''
+
+
+class SamplingProfiler:
+    """Samples the call stack of one thread at a fixed interval.
+
+    Used as a context manager around the code to profile; it runs in a
+    background thread. The interval is never shorter than the interpreter's
+    GIL switch interval. Samples are kept as collapsed stacks (``outer;inner``
+    function names) so they can be fed to flame graph tools.
+    """
+
+    def __init__(self, interval: Optional[float] = None, thread_id: Optional[int] = None):
+        # Sampling faster than the GIL switch interval mostly finds the
+        # sampled thread still holding the GIL, so clamp to at least that
+        self.interval = max(interval or 0, sys.getswitchinterval())
+        self.thread_id = thread_id
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _collapse(self, frame) -> str:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f'{os.path.basename(code.co_filename)}:{code.co_name}')
+            frame = frame.f_back
+        return ';'.join(reversed(stack))
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples[self._collapse(frame)] += 1
+
+    def start(self) -> None:
+        """Start sampling (the calling thread, unless thread_id was given)."""
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'SamplingProfiler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def top(self, n: int = 20) -> List[Dict[str, Any]]:
+        """Return the n most frequently sampled stacks."""
+        return [{'stack': stack, 'samples': count}
+                for stack, count in self.samples.most_common(n)]
+
+    def collapsed(self) -> str:
+        """Return all samples in collapsed-stack format."""
+        return '\n'.join(f'{stack} {count}' for stack, count in self.samples.items())
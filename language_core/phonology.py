@@ -3,6 +3,7 @@
 from typing import List, Dict, Any
 import random
 import re
+from .config import cached_artifact, freeze
 
 class Phoneme:
     """Represents a single sound unit in the language."""
@@ -21,11 +22,21 @@ class PhonologyGenerator:
     """Generates the sound system for the language."""
     
     def __init__(self, config: Dict[str, Any]):
-        self.config = config['phonology']
-        self.consonants = self._create_phonemes(self.config['consonants'], 'consonant')
-        self.vowels = self._create_phonemes(self.config['vowels'], 'vowel')
+        self.config = freeze(config['phonology'])
+        consonants, vowels, valid_symbols = cached_artifact(
+            (type(self), 'inventory'), self.config, self._build_inventory)
+        self.consonants = list(consonants)
+        self.vowels = list(vowels)
+        self.valid_symbols = valid_symbols
         self.syllable_structure = self.config['syllable_structure']
         self.max_syllables = self.config['max_syllables']
+    
+    def _build_inventory(self) -> tuple:
+        """Build the phoneme tables; shared by generators with equal configs."""
+        consonants = self._create_phonemes(self.config['consonants'], 'consonant')
+        vowels = self._create_phonemes(self.config['vowels'], 'vowel')
+        valid_symbols = frozenset(self.config['consonants'] + self.config['vowels'])
+        return tuple(consonants), tuple(vowels), valid_symbols
         
     def _create_phonemes(self, symbols: str, phoneme_type: str) -> List[Phoneme]:
         """Create Phoneme objects from symbols."""
@@ -138,5 +149,4 @@ class PhonologyGenerator:
     def is_valid_word(self, word: str) -> bool:
         """Check if a word follows the language's phonological rules."""
         # Basic validation: check if word only contains valid phonemes
-        valid_symbols = set(self.config['consonants'] + self.config['vowels'])
-        return all(char in valid_symbols for char in word)
+        return all(char in self.valid_symbols for char in word)
@@ -1,7 +1,16 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterable, Optional, Set, Tuple
+import json
+import re
 import numpy as np
 from collections import defaultdict
 from .base import LanguageComponent
+from .config import DEFAULT_CONFIG
+from . import metrics
+
+# Give up on a word after this many consecutive collisions
+MAX_FORM_RETRIES = 10000
+
+PLACEHOLDER_MEANING = re.compile(r'(\w+?)_meaning_(\d+)')
 
 class Word:
     """Represents a word in the generated language."""
@@ -20,14 +29,53 @@ class Word:
         return f"{self.form} ({self.pos}): {self.meaning}"
 
 class VocabularyGenerator(LanguageComponent):
-    """Generates vocabulary for the artificial language."""
+    """Generates vocabulary for the artificial language.
+    
+    The generator keeps its lexicon between calls: ``extend`` and
+    ``add_meanings`` generate and inflect only new entries and append them,
+    reusing the index of forms already in use.
+    
+    The weights in ``vocabulary.distribution`` must add up to 1 (compiled
+    configs are validated for this): ``generate`` sizes each part of speech
+    as ``int(size * weight)``, while ``extend`` splits exactly n words in
+    proportion to the weights.
+    """
     
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        self.consonants = list('ptkbdgmnŋszʃʒfvθðhrl')
-        self.vowels = list('ieaouəɪɛæɑɔʊʌ')
-        self.syllable_patterns = ['CV', 'CVC', 'V', 'VC']
+        # Use the configured inventory so words match the writing system
+        phonology = config.get('phonology', {})
+        defaults = DEFAULT_CONFIG['phonology']
+        self.consonants = list(phonology.get('consonants', defaults['consonants']))
+        self.vowels = list(phonology.get('vowels', defaults['vowels']))
+        self.syllable_patterns = list(phonology.get('syllable_structure',
+                                                    defaults['syllable_structure']))
+        self.max_syllables = phonology.get('max_syllables', defaults['max_syllables'])
+        vocabulary = config.get('vocabulary', {})
+        defaults = DEFAULT_CONFIG['vocabulary']
+        self.initial_size = vocabulary.get('initial_size', defaults['initial_size'])
+        self.pos_distribution = dict(vocabulary.get('distribution', defaults['distribution']))
+        self.morphology = {
+            'NOUN': {
+                'number': ['singular', 'plural'],
+                'case': ['nominative', 'accusative']
+            },
+            'VERB': {
+                'tense': ['present', 'past', 'future']
+            }
+        }
+        self._reset()
+        
+    def _reset(self) -> None:
+        """Forget the current lexicon."""
         self.vocabulary = defaultdict(list)
+        # (base word, variants) pairs in creation order; variants is None when
+        # the base word has no inflected forms
+        self.entries: List[Tuple[Word, Optional[List[Word]]]] = []
+        self.used_forms = set()
+        self.known_meanings = set()
+        self.pos_counts = defaultdict(int)
+        self._saved = 0
         
     def generate_syllable(self) -> str:
         """Generate a single syllable based on phonological patterns."""
@@ -42,47 +90,52 @@ class VocabularyGenerator(LanguageComponent):
                 
         return syllable
     
-    def generate_word_form(self, min_syllables: int = 1, max_syllables: int = 3) -> str:
+    def generate_word_form(self, min_syllables: int = 1,
+                           max_syllables: Optional[int] = None) -> str:
         """Generate a word form using syllable patterns."""
+        if max_syllables is None:
+            max_syllables = self.max_syllables
         num_syllables = np.random.randint(min_syllables, max_syllables + 1)
         return ''.join(self.generate_syllable() for _ in range(num_syllables))
     
-    def generate_basic_vocabulary(self, size: int = 1000) -> Dict[str, List[Word]]:
-        """Generate basic vocabulary items across different parts of speech."""
-        pos_distribution = {
-            'NOUN': 0.4,
-            'VERB': 0.3,
-            'ADJ': 0.15,
-            'ADV': 0.05,
-            'DET': 0.05,
-            'PREP': 0.05
-        }
-        
+    def _create_words(self,
+                      entries: Iterable[Tuple[str, str]],
+                      used_forms: Set[str]) -> Dict[str, List[Word]]:
+        """Create a word with a unique form for each (pos, meaning) pair."""
         vocabulary = defaultdict(list)
-        used_forms = set()
+        created = 0
+        collisions = 0
         
-        for pos, prob in pos_distribution.items():
-            num_words = int(size * prob)
+        for pos, meaning in entries:
+            # Generate unique word form
+            retries = 0
+            while True:
+                form = self.generate_word_form()
+                if form not in used_forms:
+                    used_forms.add(form)
+                    break
+                collisions += 1
+                retries += 1
+                if retries > MAX_FORM_RETRIES:
+                    raise ValueError(f"No unused word form found after {retries} attempts; "
+                                     "the phoneme inventory is too small for this vocabulary")
             
-            for i in range(num_words):
-                # Generate unique word form
-                while True:
-                    form = self.generate_word_form()
-                    if form not in used_forms:
-                        used_forms.add(form)
-                        break
-                
-                # Create placeholder meaning (in practice, this would be more sophisticated)
-                meaning = f"{pos.lower()}_meaning_{i}"
-                
-                word = Word(form=form,
-                           meaning=meaning,
-                           pos=pos)
-                           
-                vocabulary[pos].append(word)
+            vocabulary[pos].append(Word(form=form, meaning=meaning, pos=pos))
+            created += 1
         
+        # Counted locally so the retry loop stays free of metric calls
+        metrics.increment('vocabulary_words_total', created)
+        metrics.increment('vocabulary_form_collisions_total', collisions)
         return vocabulary
     
+    def generate_basic_vocabulary(self, size: int = 1000) -> Dict[str, List[Word]]:
+        """Generate basic vocabulary items across different parts of speech."""
+        # Create placeholder meanings (in practice, this would be more sophisticated)
+        entries = ((pos, f"{pos.lower()}_meaning_{i}")
+                   for pos, prob in self.pos_distribution.items()
+                   for i in range(int(size * prob)))
+        return self._create_words(entries, set())
+    
     def apply_morphology(self, word: Word, morphology: Dict[str, List[str]]) -> List[Word]:
         """Apply morphological rules to generate word forms."""
         if word.pos not in morphology:
@@ -107,32 +160,123 @@ class VocabularyGenerator(LanguageComponent):
                 
         return variants
     
-    def generate(self) -> Dict[str, Any]:
-        """Generate complete vocabulary for the language."""
-        # Generate basic vocabulary
-        basic_vocabulary = self.generate_basic_vocabulary()
-        
-        # Generate morphological variants
-        morphology = {
-            'NOUN': {
-                'number': ['singular', 'plural'],
-                'case': ['nominative', 'accusative']
-            },
-            'VERB': {
-                'tense': ['present', 'past', 'future']
-            }
-        }
-        
+    def _add_entries(self, entries: Iterable[Tuple[str, str]]) -> Dict[str, List[Word]]:
+        """Create, inflect and append new entries; return the new word forms."""
+        basic_vocabulary = self._create_words(entries, self.used_forms)
         expanded_vocabulary = defaultdict(list)
         
-        for pos, words in basic_vocabulary.items():
-            for word in words:
-                variants = self.apply_morphology(word, morphology)
-                expanded_vocabulary[pos].extend(variants)
+        with metrics.timer('morphology_expansion_seconds'):
+            for pos, words in basic_vocabulary.items():
+                for word in words:
+                    variants = self.apply_morphology(word, self.morphology)
+                    expanded_vocabulary[pos].extend(variants)
+                    self.known_meanings.add((pos, word.meaning))
+                    self.entries.append((word, variants if pos in self.morphology else None))
+                self.vocabulary[pos].extend(expanded_vocabulary[pos])
+        metrics.increment('morphology_variants_total',
+                          sum(len(words) for words in expanded_vocabulary.values()))
         
-        self.vocabulary = expanded_vocabulary
         return dict(expanded_vocabulary)
     
+    def _apportion(self, n: int) -> Dict[str, int]:
+        """Split n words across parts of speech using the largest remainder."""
+        total = sum(self.pos_distribution.values())
+        if total <= 0:
+            raise ValueError("vocabulary.distribution weights must have a positive total")
+        shares = {pos: n * prob / total for pos, prob in self.pos_distribution.items()}
+        counts = {pos: int(share) for pos, share in shares.items()}
+        remainder = n - sum(counts.values())
+        for pos in sorted(shares, key=lambda p: counts[p] - shares[p])[:remainder]:
+            counts[pos] += 1
+        return counts
+    
+    def _placeholder_entries(self, counts: Dict[str, int]) -> List[Tuple[str, str]]:
+        """Allocate the next placeholder meanings for each part of speech."""
+        entries = []
+        for pos, count in counts.items():
+            i = self.pos_counts[pos]
+            for _ in range(count):
+                while (pos, f"{pos.lower()}_meaning_{i}") in self.known_meanings:
+                    i += 1
+                entries.append((pos, f"{pos.lower()}_meaning_{i}"))
+                i += 1
+            self.pos_counts[pos] = i
+        return entries
+    
+    def extend(self, n: int, pos: Optional[str] = None) -> Dict[str, List[Word]]:
+        """Add n new words, all of one part of speech or spread by distribution.
+        
+        Only the new words are generated and inflected; they are appended to
+        ``self.vocabulary`` and returned.
+        """
+        # bool is a subclass of int but never a valid count
+        if not isinstance(n, int) or isinstance(n, bool) or n < 0:
+            raise ValueError(f"Number of words must be a non-negative integer: {n!r}")
+        counts = {pos: n} if pos else self._apportion(n)
+        return self._add_entries(self._placeholder_entries(counts))
+    
+    def add_meanings(self, meanings: Iterable[str], pos: str = 'NOUN') -> Dict[str, List[Word]]:
+        """Add a word for each meaning not yet in the lexicon."""
+        entries = []
+        for meaning in meanings:
+            if (pos, meaning) not in self.known_meanings:
+                self.known_meanings.add((pos, meaning))
+                entries.append((pos, meaning))
+        return self._add_entries(entries)
+    
+    def generate(self) -> Dict[str, Any]:
+        """Generate complete vocabulary for the language."""
+        self._reset()
+        
+        size = self.initial_size
+        counts = {pos: int(size * prob) for pos, prob in self.pos_distribution.items()}
+        self._add_entries(self._placeholder_entries(counts))
+        # Copy the lists so later extend() calls don't change the result
+        return {pos: list(words) for pos, words in self.vocabulary.items()}
+    
+    def _write_entries(self, f, entries: Iterable[Tuple[Word, Optional[List[Word]]]]) -> None:
+        for word, variants in entries:
+            record = {'form': word.form, 'meaning': word.meaning, 'pos': word.pos}
+            if variants is not None:
+                record['variants'] = [[v.form, v.morphology] for v in variants]
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    
+    def save(self, path: str) -> None:
+        """Save the lexicon to a JSON Lines file, one base word per line."""
+        with open(path, 'w', encoding='utf-8') as f:
+            self._write_entries(f, self.entries)
+        self._saved = len(self.entries)
+    
+    def append(self, path: str) -> None:
+        """Append the words added since the last save, append or load."""
+        with open(path, 'a', encoding='utf-8') as f:
+            self._write_entries(f, self.entries[self._saved:])
+        self._saved = len(self.entries)
+    
+    def load(self, path: str) -> None:
+        """Load a lexicon written by ``save``; later calls extend it."""
+        self._reset()
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                record = json.loads(line)
+                word = Word(form=record['form'], meaning=record['meaning'], pos=record['pos'])
+                variants = None
+                if 'variants' in record:
+                    variants = [Word(form=form, meaning=word.meaning, pos=word.pos,
+                                     morphology=morphology)
+                                for form, morphology in record['variants']]
+                self.entries.append((word, variants))
+                self.vocabulary[word.pos].extend(variants if variants is not None else [word])
+                self.used_forms.add(word.form)
+                self.known_meanings.add((word.pos, word.meaning))
+                # Continue numbering after the highest placeholder meaning;
+                # meanings from add_meanings don't advance the counter
+                match = PLACEHOLDER_MEANING.fullmatch(word.meaning)
+                if match and match.group(1) == word.pos.lower():
+                    index = int(match.group(2)) + 1
+                    self.pos_counts[word.pos] = max(self.pos_counts[word.pos], index)
+        self._saved = len(self.entries)
+    
     def validate(self, vocabulary: Dict[str, List[Word]]) -> bool:
         """Validate the generated vocabulary."""
         if not vocabulary:
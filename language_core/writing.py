@@ -0,0 +1,250 @@
+"""Writing system (orthography) generation module."""
+
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+import random
+from .base import LanguageComponent
+from .config import DEFAULT_CONFIG, WRITING_TYPES
+
+# Candidate spellings for IPA symbols that have no plain Latin letter.
+# Single characters come first, digraphs last.
+ROMANIZATIONS = {
+    'ŋ': ['ñ', 'ŋ', 'ng', 'nh'],
+    'ʃ': ['š', 'x', 'sh', 'sj'],
+    'ʒ': ['ž', 'j', 'zh', 'zj'],
+    'θ': ['þ', 'ŧ', 'th', 'tz'],
+    'ð': ['đ', 'ð', 'dh', 'dz'],
+    'ə': ['ë', 'y', 'eu', 'ae'],
+    'ɪ': ['ı', 'ï', 'ih', 'iy'],
+    'ɛ': ['è', 'ę', 'eh', 'ee'],
+    'æ': ['ä', 'æ', 'ae', 'ea'],
+    'ɑ': ['â', 'à', 'aa', 'ah'],
+    'ɔ': ['ò', 'ø', 'aw', 'oa'],
+    'ʊ': ['ù', 'ü', 'uh', 'ou'],
+    'ʌ': ['ŭ', 'ö', 'uu', 'oe'],
+}
+
+# Yi Syllables block: large enough for every CV, V and C sign of the
+# default inventory.
+SYLLABARY_START = 0xA000
+SYLLABARY_SIZE = 1165
+
+
+class Transliterator:
+    """Longest-match transliteration automaton compiled from a mapping.
+
+    The mapping is compiled into a trie; at every position of the input the
+    longest key is replaced by its value. Characters that start no key are
+    copied through unchanged, so whole documents (spaces, punctuation) can be
+    converted in one pass.
+    """
+
+    _END = None
+
+    def __init__(self, mapping: Dict[str, str]):
+        self.mapping = dict(mapping)
+        self.trie: Dict[Any, Any] = {}
+        for key, value in self.mapping.items():
+            if not key:
+                raise ValueError("Transliteration keys must be non-empty")
+            node = self.trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[self._END] = value
+
+    def match(self, text: str, start: int) -> Tuple[int, Optional[str]]:
+        """Return the length and value of the longest key at ``start``."""
+        node = self.trie
+        length, value = 0, None
+        i = start
+        while i < len(text):
+            node = node.get(text[i])
+            if node is None:
+                break
+            i += 1
+            if self._END in node:
+                length, value = i - start, node[self._END]
+        return length, value
+
+    def segment(self, text: str) -> List[Tuple[str, str]]:
+        """Split text into (source, target) pairs using longest match."""
+        segments = []
+        i = 0
+        while i < len(text):
+            length, value = self.match(text, i)
+            if length:
+                segments.append((text[i:i + length], value))
+                i += length
+            else:
+                segments.append((text[i], text[i]))
+                i += 1
+        return segments
+
+    def transliterate(self, text: str) -> str:
+        """Convert a single string."""
+        return ''.join(target for _, target in self.segment(text))
+
+    def transliterate_many(self, texts: Iterable[str]) -> List[str]:
+        """Convert many strings, converting each distinct string only once."""
+        cache: Dict[str, str] = {}
+        results = []
+        for text in texts:
+            if text not in cache:
+                cache[text] = self.transliterate(text)
+            results.append(cache[text])
+        return results
+
+
+class Orthography:
+    """A phoneme-to-grapheme spelling system with automata in both directions."""
+
+    def __init__(self, graphemes: Dict[str, str], separator: str = "'"):
+        self.graphemes = dict(graphemes)
+        self.separator = separator
+        if len(set(self.graphemes.values())) != len(self.graphemes):
+            raise ValueError("Graphemes must be unique")
+        self.to_script = Transliterator(self.graphemes)
+        inverse = {grapheme: ipa for ipa, grapheme in self.graphemes.items()}
+        inverse[separator] = ''
+        self.to_ipa = Transliterator(inverse)
+
+    def write(self, ipa: str) -> str:
+        """Spell an IPA string in the native script.
+
+        A separator is inserted wherever two adjacent graphemes would
+        otherwise read back as a different, longer grapheme (e.g. ``s`` +
+        ``h`` against a ``sh`` digraph), so ``read(write(x)) == x``.
+        """
+        chunks = [target for _, target in self.to_script.segment(ipa)]
+        if len(chunks) < 2:
+            return ''.join(chunks)
+        text = ''.join(chunks)
+        output = []
+        position = 0
+        for i, chunk in enumerate(chunks):
+            if i and chunks[i - 1] in self.to_ipa.mapping:
+                length, _ = self.to_ipa.match(text, position - len(chunks[i - 1]))
+                if length > len(chunks[i - 1]):
+                    output.append(self.separator)
+            output.append(chunk)
+            position += len(chunk)
+        return ''.join(output)
+
+    def read(self, script: str) -> str:
+        """Convert native script back to IPA."""
+        return self.to_ipa.transliterate(script)
+
+    def write_many(self, texts: Iterable[str]) -> List[str]:
+        """Spell many IPA strings, converting each distinct string once."""
+        cache: Dict[str, str] = {}
+        results = []
+        for text in texts:
+            if text not in cache:
+                cache[text] = self.write(text)
+            results.append(cache[text])
+        return results
+
+    def read_many(self, texts: Iterable[str]) -> List[str]:
+        """Convert many script strings back to IPA."""
+        return self.to_ipa.transliterate_many(texts)
+
+    def write_lexicon(self, vocabulary: Dict[str, List[Any]]) -> Dict[str, List[str]]:
+        """Spell every word form of a vocabulary, keyed by part of speech."""
+        return {
+            pos: self.write_many(word.form for word in words)
+            for pos, words in vocabulary.items()
+        }
+
+
+class WritingSystemGenerator(LanguageComponent):
+    """Generates an orthography for the artificial language."""
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        phonology = config.get('phonology', {})
+        writing = config.get('writing', {})
+        defaults = DEFAULT_CONFIG['phonology']
+        self.consonants = list(phonology.get('consonants', defaults['consonants']))
+        self.vowels = list(phonology.get('vowels', defaults['vowels']))
+        self.writing_type = writing.get('type')
+        self.separator = writing.get('separator', "'")
+        self.orthography = None
+
+    def _pick(self, phoneme: str, used: set, prefer_digraphs: bool) -> str:
+        """Choose an unused Latin spelling for a phoneme."""
+        candidates = [c for c in ROMANIZATIONS.get(phoneme, []) if c not in used]
+        singles = [c for c in candidates if len(c) == 1]
+        digraphs = [c for c in candidates if len(c) > 1]
+        pool = (digraphs or singles) if prefer_digraphs else (singles or digraphs)
+        if pool:
+            return random.choice(pool)
+        # Fall back to the IPA symbol itself, or a marked form of it
+        for candidate in (phoneme, phoneme + '\u0301', phoneme + '\u0300'):
+            if candidate not in used:
+                return candidate
+        raise ValueError(f"No spelling available for phoneme {phoneme!r}")
+
+    def generate_alphabet(self, prefer_digraphs: bool = False) -> Dict[str, str]:
+        """Map each phoneme to a letter or digraph."""
+        graphemes = {}
+        # Plain Latin phonemes keep their own letter
+        used = {p for p in self.consonants + self.vowels if p.isascii()}
+        used.add(self.separator)
+        for phoneme in self.consonants + self.vowels:
+            if phoneme.isascii():
+                graphemes[phoneme] = phoneme
+                continue
+            grapheme = self._pick(phoneme, used, prefer_digraphs)
+            used.add(grapheme)
+            graphemes[phoneme] = grapheme
+        return graphemes
+
+    def generate_syllabary(self) -> Dict[str, str]:
+        """Map each CV syllable, bare vowel and bare consonant to one sign."""
+        units = [c + v for c in self.consonants for v in self.vowels]
+        units += self.vowels + self.consonants
+        if len(units) > SYLLABARY_SIZE:
+            raise ValueError(
+                f"Inventory needs {len(units)} signs, only {SYLLABARY_SIZE} available")
+        signs = random.sample(range(SYLLABARY_START, SYLLABARY_START + SYLLABARY_SIZE),
+                              len(units))
+        return {unit: chr(sign) for unit, sign in zip(units, signs)}
+
+    def generate(self) -> Dict[str, Any]:
+        """Generate the writing system and compile its transliterators."""
+        writing_type = self.writing_type or random.choice(WRITING_TYPES)
+        if writing_type == 'alphabet':
+            graphemes = self.generate_alphabet()
+        elif writing_type == 'digraph':
+            graphemes = self.generate_alphabet(prefer_digraphs=True)
+        elif writing_type == 'syllabary':
+            graphemes = self.generate_syllabary()
+        else:
+            raise ValueError(f"Unknown writing system type: {writing_type}")
+
+        self.orthography = Orthography(graphemes, separator=self.separator)
+        return {
+            'type': writing_type,
+            'graphemes': graphemes,
+            'separator': self.separator,
+            'orthography': self.orthography,
+        }
+
+    def validate(self, writing: Dict[str, Any]) -> bool:
+        """Validate that every phoneme is spelled and spellings are unique."""
+        if not writing:
+            return False
+
+        required_keys = ['type', 'graphemes', 'separator']
+        if not all(key in writing for key in required_keys):
+            return False
+
+        graphemes = writing['graphemes']
+        if not isinstance(graphemes, dict) or not graphemes:
+            return False
+        if len(set(graphemes.values())) != len(graphemes):
+            return False
+        if any(writing['separator'] in g for g in graphemes.values()):
+            return False
+
+        # Every single phoneme must be writable on its own
+        return all(p in graphemes for p in self.consonants + self.vowels)
@@ -11,6 +11,11 @@ setup(
         'PyYAML>=6.0.0',
         'pytest>=7.0.0'
     ],
+    entry_points={
+        'console_scripts': [
+            'languagegen=language_core.cli:main',
+        ],
+    },
     author="AI Language Generator Team",
     description="A system for generating artificial languages",
     python_requires='>=3.8',
@@ -0,0 +1,61 @@
+"""Test cases for the API instrumentation."""
+
+import os
+import sys
+import pytest
+from fastapi.testclient import TestClient
+from language_core import metrics
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'backend'))
+import main
+
+@pytest.fixture
+def client():
+    metrics.reset()
+    yield TestClient(main.app)
+    metrics.disable()
+    metrics.reset()
+
+def test_disabled_middleware_does_nothing(client, monkeypatch):
+    """Test that requests pass straight through while metrics are off."""
+    metrics.disable()
+    monkeypatch.setattr(metrics, 'SamplingProfiler', None)
+    assert client.get('/').status_code == 200
+    response = client.post('/api/create-language?profile=true').json()
+    assert 'profile' not in response
+    assert metrics.snapshot() == {'counters': {}, 'timers': {}}
+
+def test_requests_labelled_by_route(client):
+    """Test that requests are labelled by route, with one unmatched series."""
+    metrics.enable()
+    language_id = client.post('/api/create-language').json()['id']
+    client.post(f'/api/translate/{language_id}', json={'text': 'hello world'})
+    client.get('/nope/abc')
+    client.get('/nope/def')
+    requests = metrics.snapshot()['counters']['requests_total']
+    assert requests == {
+        (('endpoint', '/api/create-language'), ('status', '200')): 1,
+        (('endpoint', '/api/translate/{language_id}'), ('status', '200')): 1,
+        (('endpoint', '<unmatched>'), ('status', '404')): 2,
+    }
+
+def test_profile(client):
+    """Test that ?profile=true adds sampled stacks while metrics are on."""
+    metrics.enable()
+    language_id = client.post('/api/create-language').json()['id']
+    # Long enough to span several sampling intervals
+    response = client.post(f'/api/translate/{language_id}?profile=true',
+                           json={'text': 'word ' * 5000})
+    content = response.json()
+    assert content['profile']
+    assert any('translate_text' in p['stack'] for p in content['profile'])
+    assert int(response.headers['content-length']) == len(response.content)
+
+def test_metrics_endpoint(client):
+    """Test the Prometheus endpoint."""
+    metrics.enable()
+    client.get('/')
+    response = client.get('/metrics')
+    assert response.headers['content-type'].startswith('text/plain')
+    assert 'languagegen_requests_total{endpoint="/",status="200"} 1' in response.text
+    assert 'languagegen_request_seconds_count{endpoint="/"} 1' in response.text
@@ -0,0 +1,83 @@
+"""Test cases for the languagegen command-line tool."""
+
+import gzip
+import json
+import os
+import pytest
+from language_core.cli import main, expand_grid, generate_shard, shard_path
+
+def read_shard(output, shard):
+    with gzip.open(shard_path(output, shard), 'rt', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+def test_expand_grid():
+    """Test expansion of dotted keys into config variations."""
+    variations = expand_grid({'writing.type': ['alphabet', 'syllabary'],
+                              'phonology.max_syllables': [2, 3]})
+    assert len(variations) == 4
+    assert {'phonology': {'max_syllables': 2}, 'writing': {'type': 'alphabet'}} in variations
+    assert expand_grid({}) == [{}]
+
+def test_failed_shard_leaves_no_file(tmp_path):
+    """Test that the original error surfaces when the shard file was never created."""
+    output = str(tmp_path / 'missing')
+    with pytest.raises(FileNotFoundError) as excinfo:
+        generate_shard(output, 0, [0], 0, {}, [{}])
+    # Not raised again while cleaning up the temporary file
+    assert excinfo.value.__context__ is None
+
+def test_generate_shards(tmp_path):
+    """Test that languages are written to compressed shards."""
+    output = str(tmp_path)
+    assert main(['--count', '3', '--shard-size', '2', '--workers', '1',
+                 '--output', output]) == 0
+    first, second = read_shard(output, 0), read_shard(output, 1)
+    assert [r['index'] for r in first + second] == [0, 1, 2]
+    language = first[0]['language']
+    assert set(language) == {'grammar', 'vocabulary', 'writing'}
+    assert 'written' in language['vocabulary']['NOUN'][0]
+
+def test_resume(tmp_path):
+    """Test that a resumed run only regenerates missing shards, identically."""
+    output = str(tmp_path)
+    args = ['--count', '4', '--shard-size', '2', '--workers', '1', '--output', output]
+    main(args)
+    expected = read_shard(output, 1)
+    os.remove(shard_path(output, 1))
+
+    with pytest.raises(SystemExit):
+        main(args)
+    main(args + ['--resume'])
+    assert read_shard(output, 1) == expected
+
+    with pytest.raises(SystemExit):
+        main(['--count', '4', '--shard-size', '2', '--seed', '1', '--workers', '1',
+              '--output', output, '--resume'])
+
+@pytest.mark.parametrize('grid', ['writing.type: [cuneiform]\n',
+                                  'grammar.word_order: [SOV]\n',
+                                  'phonology.consonants: ptk\n',
+                                  'phonology.max_syllables: []\n',
+                                  '- phonology.max_syllables\n'])
+def test_invalid_grid(tmp_path, grid):
+    """Test that bad or unused grid keys fail before anything is written."""
+    grid_path = tmp_path / 'grid.yaml'
+    grid_path.write_text(grid)
+    output = str(tmp_path / 'out')
+    with pytest.raises(SystemExit):
+        main(['--count', '2', '--workers', '1', '--output', output, '--grid', str(grid_path)])
+    assert not os.path.exists(output)
+
+def test_grid_phonology_reaches_vocabulary(tmp_path):
+    """Test that a configured inventory is used by the vocabulary."""
+    grid_path = tmp_path / 'grid.yaml'
+    grid_path.write_text("phonology.consonants: [ptkmn]\nwriting.type: [alphabet]\n")
+    output = str(tmp_path / 'out')
+    main(['--count', '1', '--workers', '1', '--output', output, '--grid', str(grid_path)])
+    language = read_shard(output, 0)[0]['language']
+    words = language['vocabulary']['NOUN']
+    assert all(set(word['form']) <= set('ptkmnieaouəɪɛæɑɔʊʌ') for word in words)
+    # Written forms use only the generated graphemes, never raw IPA
+    letters = set(''.join(language['writing']['graphemes'].values()))
+    letters |= set(language['writing']['separator'])
+    assert all(set(word['written']) <= letters for word in words)
@@ -0,0 +1,107 @@
+"""Test cases for the configuration module."""
+
+import pytest
+import os
+from language_core import config as config_module
+from language_core.config import (DEFAULT_CONFIG, CACHE_SIZE, FrozenConfig, load_config,
+                                  save_config, compile_config, deep_merge, cached_artifact,
+                                  clear_config_cache)
+from language_core.phonology import PhonologyGenerator
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+def test_deep_merge_keeps_nested_defaults():
+    """Test that overriding one nested key keeps its siblings."""
+    merged = deep_merge(DEFAULT_CONFIG, {'phonology': {'max_syllables': 5}})
+    assert merged['phonology']['max_syllables'] == 5
+    assert merged['phonology']['vowels'] == DEFAULT_CONFIG['phonology']['vowels']
+    # The defaults are not shared with the result
+    merged['phonology']['syllable_structure'].append('CCV')
+    assert 'CCV' not in DEFAULT_CONFIG['phonology']['syllable_structure']
+
+def test_distribution_replaced_as_a_whole():
+    """Test that a distribution override can drop default parts of speech."""
+    config = compile_config({'vocabulary': {'distribution': {'NOUN': 0.6, 'VERB': 0.4}}})
+    assert dict(config['vocabulary']['distribution']) == {'NOUN': 0.6, 'VERB': 0.4}
+    assert config['vocabulary']['initial_size'] == 1000
+
+def test_compiled_config_is_frozen_and_cached():
+    """Test that compiled configs are immutable, hashable and reused."""
+    config = compile_config({'grammar': {'word_order': 'SOV'}})
+    assert isinstance(config, FrozenConfig)
+    assert config['grammar']['word_order'] == 'SOV'
+    assert config['grammar']['alignment'] == 'nominative-accusative'
+    assert hash(config) == hash(compile_config({'grammar': {'word_order': 'SOV'}}))
+    assert compile_config({'grammar': {'word_order': 'SOV'}}) is config
+    with pytest.raises(TypeError):
+        config['grammar'] = {}
+
+@pytest.mark.parametrize('overrides', [
+    {'phonology': {'max_syllables': 0}},
+    {'phonology': {'syllable_structure': ['CXV']}},
+    {'phonology': {'vowels': 'aeiou', 'consonants': 'pta'}},
+    {'grammar': {'word_order': 'XYZ'}},
+    {'vocabulary': 'large'},
+    {'vocabulary': {'distribution': 'x'}},
+    {'vocabulary': {'distribution': {'NOUN': True}}},
+    {'vocabulary': {'initial_size': False}},
+    {'phonology': {'max_syllables': True}},
+    {'writing': {'type': 'cuneiform'}},
+    {'writing': {'separator': 'a'}},
+    {'vocabulary': {'distribution': {'PRON': 0.1}}},
+    {'vocabulary': {'distribution': {'NOUN': 0}}},
+    ['phonology'],
+])
+def test_invalid_config(overrides):
+    """Test that invalid values are rejected."""
+    with pytest.raises(ValueError):
+        compile_config(overrides)
+
+def test_load_config_from_file(tmp_path):
+    """Test loading, merging and round-tripping a YAML file."""
+    path = tmp_path / 'config.yaml'
+    save_config({'phonology': {'consonants': 'ptk'}}, str(path))
+    config = load_config(str(path))
+    assert config['phonology']['consonants'] == 'ptk'
+    assert config['phonology']['max_syllables'] == 3
+    assert load_config(str(path)) is config
+    save_config(config, str(path))
+    assert load_config(str(path)) == config
+
+def test_load_config_non_mapping(tmp_path):
+    """Test that a YAML file without a top-level mapping is rejected."""
+    path = tmp_path / 'config.yaml'
+    path.write_text('- phonology\n')
+    with pytest.raises(ValueError):
+        load_config(str(path))
+
+def test_file_cache_keeps_latest_version(tmp_path):
+    """Test that re-reading an edited file replaces its cache entry."""
+    path = tmp_path / 'config.yaml'
+    for i, consonants in enumerate(['ptk', 'ptkm', 'ptkmn']):
+        save_config({'phonology': {'consonants': consonants}}, str(path))
+        os.utime(path, ns=(i, i))
+        assert load_config(str(path))['phonology']['consonants'] == consonants
+    assert len(config_module._FILE_CACHE) == 1
+
+def test_artifact_cache_is_bounded():
+    """Test that the artifact cache drops the least recently used entries."""
+    for i in range(CACHE_SIZE + 10):
+        cached_artifact('table', {'i': i}, lambda: i)
+    assert len(config_module._ARTIFACT_CACHE) == CACHE_SIZE
+
+def test_artifacts_shared_between_generators():
+    """Test that derived tables are built once per config."""
+    calls = []
+    build = lambda: calls.append(1) or 'table'
+    assert cached_artifact('table', load_config(), build) == 'table'
+    assert cached_artifact('table', load_config(), build) == 'table'
+    assert len(calls) == 1
+
+    first = PhonologyGenerator(load_config())
+    second = PhonologyGenerator(load_config())
+    assert first.consonants[0] is second.consonants[0]
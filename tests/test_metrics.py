@@ -0,0 +1,65 @@
+"""Test cases for the metrics module."""
+
+import time
+import pytest
+from language_core import metrics
+from language_core.base import LanguageGenerator
+from language_core.config import load_config
+from language_core.grammar import GrammarGenerator
+
+@pytest.fixture(autouse=True)
+def enabled_metrics():
+    metrics.reset()
+    metrics.enable()
+    yield
+    metrics.disable()
+    metrics.reset()
+
+def test_disabled_records_nothing():
+    """Test that nothing is recorded while disabled."""
+    metrics.disable()
+    metrics.increment('calls_total')
+    with metrics.timer('block_seconds'):
+        pass
+    assert metrics.snapshot() == {'counters': {}, 'timers': {}}
+
+def test_counters_and_timers():
+    """Test counter and timer aggregation per label set."""
+    metrics.increment('calls_total', endpoint='a')
+    metrics.increment('calls_total', 2, endpoint='a')
+    metrics.increment('calls_total', endpoint='b')
+    for _ in range(3):
+        with metrics.timer('block_seconds'):
+            pass
+    data = metrics.snapshot()
+    assert data['counters']['calls_total'] == {(('endpoint', 'a'),): 3,
+                                               (('endpoint', 'b'),): 1}
+    assert data['timers']['block_seconds'][()]['count'] == 3
+
+def test_prometheus_format():
+    """Test the Prometheus text rendering."""
+    metrics.increment('calls_total', endpoint='a')
+    metrics.observe('block_seconds', 0.5)
+    text = metrics.render_prometheus()
+    assert '# TYPE languagegen_calls_total counter' in text
+    assert 'languagegen_calls_total{endpoint="a"} 1' in text
+    assert 'languagegen_block_seconds_count 1' in text
+    assert 'languagegen_block_seconds_sum 0.5' in text
+
+def test_component_timers():
+    """Test that generate_language times each component."""
+    config = load_config()
+    generator = LanguageGenerator(config)
+    generator.add_component('grammar', GrammarGenerator(config))
+    generator.generate_language()
+    timers = metrics.snapshot()['timers']['component_generate_seconds']
+    assert timers[(('component', 'grammar'),)]['count'] == 1
+
+def test_sampling_profiler():
+    """Test that the profiler samples the calling thread."""
+    with metrics.SamplingProfiler(interval=0.001) as profiler:
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            pass
+    assert profiler.samples
+    assert 'test_sampling_profiler' in profiler.top(1)[0]['stack']
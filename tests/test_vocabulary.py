@@ -0,0 +1,90 @@
+"""Test cases for the vocabulary module."""
+
+import numpy as np
+import pytest
+from language_core.config import load_config
+from language_core.vocabulary import VocabularyGenerator
+
+@pytest.fixture
+def vocabulary():
+    np.random.seed(0)
+    vocab_gen = VocabularyGenerator(load_config())
+    vocab_gen.generate()
+    return vocab_gen
+
+def base_forms(vocab_gen):
+    return [word.form for word, _ in vocab_gen.entries]
+
+def test_generate(vocabulary):
+    """Test that generate builds a valid, inflected lexicon."""
+    assert len(vocabulary.entries) == 1000
+    assert vocabulary.validate(dict(vocabulary.vocabulary))
+    assert len(vocabulary.vocabulary['NOUN']) == 400 * 4
+    assert len(vocabulary.vocabulary['ADJ']) == 150
+
+def test_extend_appends_only_new_words(vocabulary):
+    """Test that extend keeps existing words and adds exactly n new ones."""
+    before = list(vocabulary.vocabulary['VERB'])
+    new_words = vocabulary.extend(7)
+    assert len(vocabulary.entries) == 1007
+    assert vocabulary.vocabulary['VERB'][:len(before)] == before
+    assert sum(len(words) for words in new_words.values()) > 0
+    assert len(set(base_forms(vocabulary))) == 1007
+
+    start = vocabulary.pos_counts['ADV']
+    new_words = vocabulary.extend(5, pos='ADV')
+    assert list(new_words) == ['ADV']
+    meanings = [word.meaning for word in new_words['ADV']]
+    assert meanings == [f'adv_meaning_{i}' for i in range(start, start + 5)]
+
+@pytest.mark.parametrize('n', [-3, 2.5, True, '5'])
+def test_extend_invalid_count(vocabulary, n):
+    """Test that counts other than non-negative integers are rejected."""
+    with pytest.raises(ValueError):
+        vocabulary.extend(n)
+    assert len(vocabulary.entries) == 1000
+
+def test_extend_zero_distribution():
+    """Test that a distribution without weight cannot be extended."""
+    vocab_gen = VocabularyGenerator({'vocabulary': {'distribution': {'NOUN': 0, 'VERB': 0}}})
+    with pytest.raises(ValueError):
+        vocab_gen.extend(5)
+    assert vocab_gen.extend(5, pos='NOUN')['NOUN']
+
+def test_generate_result_not_shared(vocabulary):
+    """Test that extending does not change an already returned lexicon."""
+    language = vocabulary.generate()
+    vocabulary.extend(10, pos='ADJ')
+    assert len(language['ADJ']) == 150
+
+def test_add_meanings(vocabulary):
+    """Test adding words for explicit meanings, skipping known ones."""
+    new_words = vocabulary.add_meanings(['river', 'stone', 'river'])
+    assert {word.meaning for word in new_words['NOUN']} == {'river', 'stone'}
+    assert len(vocabulary.entries) == 1002
+    assert vocabulary.add_meanings(['stone']) == {}
+
+def test_save_append_load(vocabulary, tmp_path):
+    """Test that a persisted lexicon can be reloaded and grown in place."""
+    path = str(tmp_path / 'lexicon.jsonl')
+    vocabulary.save(path)
+    vocabulary.extend(10)
+    vocabulary.append(path)
+
+    loaded = VocabularyGenerator(load_config())
+    loaded.load(path)
+    assert base_forms(loaded) == base_forms(vocabulary)
+    assert ([w.form for w in loaded.vocabulary['NOUN']]
+            == [w.form for w in vocabulary.vocabulary['NOUN']])
+
+    vocabulary.add_meanings(['river', 'stone'])
+    vocabulary.save(path)
+    loaded.load(path)
+    assert loaded.pos_counts['NOUN'] == vocabulary.pos_counts['NOUN']
+    new_words = loaded.extend(3, pos='NOUN')
+    assert ([w.meaning for w in new_words['NOUN']][::4]
+            == [w.meaning for w in vocabulary.extend(3, pos='NOUN')['NOUN']][::4])
+    loaded.append(path)
+    with open(path, encoding='utf-8') as f:
+        assert sum(1 for _ in f) == 1015
+    assert len(set(base_forms(loaded))) == 1015
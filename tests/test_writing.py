@@ -0,0 +1,44 @@
+"""Test cases for the writing system module."""
+
+import pytest
+from language_core.config import load_config
+from language_core.writing import Transliterator, Orthography, WritingSystemGenerator
+
+@pytest.fixture
+def config():
+    return load_config()
+
+@pytest.mark.parametrize('writing_type', ['alphabet', 'digraph', 'syllabary'])
+def test_writing_system_generation(config, writing_type):
+    """Test generation of each writing system type."""
+    writing_gen = WritingSystemGenerator({**config, 'writing': {'type': writing_type}})
+    writing = writing_gen.generate()
+    assert writing['type'] == writing_type
+    assert writing_gen.validate(writing)
+
+@pytest.mark.parametrize('writing_type', ['alphabet', 'digraph', 'syllabary'])
+def test_round_trip(config, writing_type):
+    """Test that script converts back to the original IPA."""
+    writing_gen = WritingSystemGenerator({**config, 'writing': {'type': writing_type}})
+    orthography = writing_gen.generate()['orthography']
+    words = ['pat', 'ʃip', 'shi', 'ŋæθə', 'eaŋg', 'aæ ʒʊ!']
+    written = orthography.write_many(words)
+    assert orthography.read_many(written) == words
+
+def test_longest_match():
+    """Test that the longest key wins and unknown characters pass through."""
+    translit = Transliterator({'s': 'S', 'sh': 'X', 'h': 'H'})
+    assert translit.transliterate('ssh sh!') == 'SX X!'
+    assert translit.transliterate_many(['sh', 'hs', 'sh']) == ['X', 'HS', 'X']
+
+def test_separator_insertion():
+    """Test that ambiguous grapheme sequences are separated."""
+    orthography = Orthography({'s': 's', 'h': 'h', 'ʃ': 'sh'})
+    assert orthography.write('sh') == "s'h"
+    assert orthography.write('ʃ') == 'sh'
+    assert orthography.read("s'hsh") == 'shʃ'
+
+def test_duplicate_graphemes():
+    """Test that non-unique graphemes are rejected."""
+    with pytest.raises(ValueError):
+        Orthography({'ʃ': 'x', 'x': 'x'})